@@ -16,11 +16,36 @@ Features:
 import zipfile
 import os
 import json
-import tempfile
-import shutil
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from html import escape
-from collections import defaultdict
+from collections import defaultdict, deque
+
+# orjson is an optional speedup: it parses UTF-8 bytes directly in native code.
+# Without it the stdlib parser is used (json.loads also accepts bytes).
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    json_backend_loads = orjson.loads
+
+    def json_dumps(obj):
+        return orjson.dumps(obj).decode("utf-8")
+else:
+    json_backend_loads = json.loads
+
+    def json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+def json_loads(data: bytes):
+    # Strip a UTF-8 BOM first: orjson rejects it while json.loads(bytes) accepts it,
+    # so both backends must see the same input to produce the same report
+    if data.startswith(b"\xef\xbb\xbf"):
+        data = data[3:]
+    return json_backend_loads(data)
 
 # -------------------------
 # Config / template names
@@ -29,21 +54,35 @@ CONFIG_FILE = "config.json"
 TEMPLATE_FILE = "cfg.html"
 OUTPUT_FILE = "resourcepack.html"
 
+# Only assets/<namespace>/<dir>/** with these top dirs can hold "when"/"model" JSON
+# (lang, sounds, texts, ... are skipped without being read)
+PARSED_ASSET_DIRS = {"models", "items", "overrides"}
+
 # -------------------------
 # Helpers: load config (ignore _comment_ keys)
 # -------------------------
 def load_config(path):
     if not path.exists():
         raise FileNotFoundError(f"Config '{path}' not found.")
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    # keyed on mtime so an edited config is re-read; copy so callers can't alter the cached dict
+    return dict(load_config_cached(str(path), path.stat().st_mtime_ns))
+
+@lru_cache(maxsize=4)
+def load_config_cached(path_str, mtime_ns):
+    raw = json_loads(Path(path_str).read_bytes())
     cfg = {k: v for k, v in raw.items() if not k.startswith("_comment")}
     # defaults
     cfg.setdefault("group_by_rename", True)
     cfg.setdefault("show_all_items_list", True)
+    cfg.setdefault("max_items_list", 5000)
     cfg.setdefault("columns_order", ["Переименования", "Предмет", "Модель"])
     cfg.setdefault("table_class", "default-table")
     cfg.setdefault("open_all_details", True)
     cfg.setdefault("title", "📦 Resourcepack report")
+    # int or null ("no limit"); bool is an int subclass but never a sensible limit
+    max_items = cfg["max_items_list"]
+    if max_items is not None and (not isinstance(max_items, int) or isinstance(max_items, bool)):
+        raise ValueError(f"Config '{path_str}': 'max_items_list' must be an integer or null, got {max_items!r}.")
     return cfg
 
 # -------------------------
@@ -93,12 +132,34 @@ def get_models_from_model_data(model_data):
 
     return found
 
+# -------------------------
+# Index of model files inside a pack (built once per zip)
+# -------------------------
+def build_model_index(asset_files):
+    """
+    asset_files: JSON paths inside the zip, relative to assets/ (e.g. "ns/models/item/x.json").
+    Returns dict:
+      "paths": set of paths that live under <ns>/.../models/...
+      "by_basename": file name without .json -> list of those paths
+      "resolved": memo of resolve_model_ref() results for this pack
+    """
+    paths = set()
+    by_basename = defaultdict(list)
+    for rel in asset_files:
+        rel_parts = rel.split("/")
+        if "models" not in rel_parts[1:-1]:
+            continue
+        paths.add(rel)
+        by_basename[rel_parts[-1][:-5]].append(rel)
+    return {"paths": paths, "by_basename": by_basename, "resolved": {}}
+
 # -------------------------
 # Resolve model reference to a file path inside assets root (if possible)
 # -------------------------
-def resolve_model_ref(model_ref, assets_root):
+def find_model_files(model_ref, index):
     """
-    Try to resolve model reference like "namespace:item/name" or "item/name" to a .json path under assets_root.
+    Try to resolve model reference like "namespace:item/name" or "item/name" to a .json path under assets/.
+    index is the per-pack lookup table from build_model_index().
     Returns list of candidate resolved JSON relative paths (strings) or empty list if not found.
     This function is best-effort: searches assets/*/models/** for matching name.
     """
@@ -120,129 +181,176 @@ def resolve_model_ref(model_ref, assets_root):
     if ":" in mr:
         ns, path = mr.split(":", 1)
         # path may start with "item/..." or "models/..." but commonly "item/..."
-        # construct expected file
-        parts = path.split("/")
+        # construct expected file (plain strings, same form as the index keys)
         # Try path as-is under ns/models/
-        candidate = assets_root / ns / "models" / Path(*parts)
-        if (candidate.with_suffix(".json")).exists():
-            candidates.append(str(candidate.with_suffix(".json").relative_to(assets_root)))
+        candidate = f"{ns}/models/{path}.json"
+        if candidate in index["paths"]:
+            candidates.append(candidate)
         # Also try direct path under ns/models/item/... (if path didn't include "item")
-        if parts[0] not in ("item", "block", "entity"):
-            candidate2 = assets_root / ns / "models" / "item" / Path(*parts)
-            if (candidate2.with_suffix(".json")).exists():
-                candidates.append(str(candidate2.with_suffix(".json").relative_to(assets_root)))
+        if path.split("/", 1)[0] not in ("item", "block", "entity"):
+            candidate2 = f"{ns}/models/item/{path}.json"
+            if candidate2 in index["paths"]:
+                candidates.append(candidate2)
     else:
         # No namespace: search any namespace for a matching models/**/<mr>.json
         # Try exact matches first (mr may include item/... or just name)
         mr_parts = mr.split("/")
-        # search assets_root/*/models/**/<last>.json and filter by tail containing mr
+        # any assets/*/models/**/<last>.json, looked up in the precomputed index
         last = mr_parts[-1]
-        for ns_dir in assets_root.iterdir():
-            if not ns_dir.is_dir():
-                continue
-            for p in ns_dir.rglob("models"):
-                # search for files with matching tail
-                for file in p.rglob(f"{last}.json"):
-                    # quick check: if path ends with the mr (joined) or contains mr parts
-                    rel = file.relative_to(assets_root)
-                    # try to match deeper: if "/".join(last k) in rel
-                    # accept it
-                    candidates.append(str(rel))
+        candidates.extend(index["by_basename"].get(last, ()))
     # dedupe preserve order
-    seen = set()
-    out = []
-    for c in candidates:
-        if c not in seen:
-            seen.add(c)
-            out.append(c)
+    return list(dict.fromkeys(candidates))
+
+def resolve_model_ref(model_ref, index):
+    """
+    Memoized find_model_files(): the same reference (e.g. "minecraft:item/stick") shows up
+    in many "when" cases of a pack, so each one is looked up only once per index.
+    """
+    cache = index["resolved"]
+    out = cache.get(model_ref)
+    if out is None:
+        out = cache[model_ref] = find_model_files(model_ref, index)
     return out
 
 # -------------------------
-# Recursive extractor: find all objects that contain "when" and "model"
+# Extractor: find all objects that contain "when" and "model"
 # -------------------------
-def extract_when_model(obj, item_name, results, assets_root):
+def add_when_model(obj, item_name, results, index, seen):
     """
-    Walks the JSON object recursively and appends tuples:
-      (item_name, list_of_when_values, list_of_model_references, source_info)
+    obj is a dict with "when" and "model": append one tuple
+      (item_name, list_of_when_values, list_of_model_references)
     where model references are resolved (if possible) to file paths or type markers.
+    seen holds (whens, models) keys already appended for this file, so duplicates are skipped.
     """
-    if isinstance(obj, dict):
-        # If structure has "when" and "model" (new style)
-        if "when" in obj and "model" in obj:
-            whens_raw = obj["when"]
-            whens = []
-            if isinstance(whens_raw, list):
-                for w in whens_raw:
-                    whens.append(str(w))
-            else:
-                whens.append(str(whens_raw))
-            whens = sorted(dict.fromkeys([w.strip() for w in whens if w is not None and str(w).strip() != ""]))
-
-            model_data = obj["model"]
-            models = get_models_from_model_data(model_data)
-            # If no explicit models collected, try parent in same object
-            if not models and "parent" in obj:
-                parent_val = obj.get("parent")
-                if isinstance(parent_val, str) and parent_val:
-                    models.append(parent_val)
-
-            # Resolve model refs to files if possible
-            resolved = []
-            for m in models:
-                candidates = resolve_model_ref(m, assets_root)
-                if candidates:
-                    resolved.extend(candidates)
-                else:
-                    # if nothing resolved just keep original m
-                    resolved.append(m)
+    whens_raw = obj["when"]
+    whens = []
+    if isinstance(whens_raw, list):
+        for w in whens_raw:
+            whens.append(str(w))
+    else:
+        whens.append(str(whens_raw))
+    whens = sorted(dict.fromkeys(w.strip() for w in whens if w is not None and str(w).strip() != ""))
+
+    model_data = obj["model"]
+    models = get_models_from_model_data(model_data)
+    # If no explicit models collected, try parent in same object
+    if not models and "parent" in obj:
+        parent_val = obj.get("parent")
+        if isinstance(parent_val, str) and parent_val:
+            models.append(parent_val)
+
+    # Resolve model refs to files if possible
+    resolved = []
+    for m in models:
+        candidates = resolve_model_ref(m, index)
+        if candidates:
+            resolved.extend(candidates)
+        else:
+            # if nothing resolved just keep original m
+            resolved.append(m)
+
+    key = (tuple(whens), tuple(resolved))
+    if key not in seen:
+        seen.add(key)
+        results.append((item_name, whens, resolved))
+
+def extract_when_model(root, item_name, results, index, seen):
+    """
+    Walks the JSON object (with an explicit stack instead of recursion) and calls
+    add_when_model() for every dict that has both "when" and "model".
+    """
+    stack = deque([root])
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            # If structure has "when" and "model" (new style)
+            if "when" in obj and "model" in obj:
+                add_when_model(obj, item_name, results, index, seen)
+            # Visit all values next (pushed reversed so document order is kept)
+            stack.extend(reversed(list(obj.values())))
+        elif isinstance(obj, list):
+            stack.extend(reversed(obj))
+
+def has_select_cases(data):
+    """
+    True for the common 1.21.6+ item definition shape:
+      {"model": {"type": "minecraft:select", ..., "cases": [{"when": ..., "model": ...}], "fallback": ...}}
+    (and neither level is itself a "when" object).
+    """
+    if not isinstance(data, dict) or "when" in data:
+        return False
+    model = data.get("model")
+    return isinstance(model, dict) and "when" not in model and isinstance(model.get("cases"), list)
 
-            results.append((item_name, whens, resolved))
-        # Recurse into all values
-        for v in obj.values():
-            extract_when_model(v, item_name, results, assets_root)
-    elif isinstance(obj, list):
-        for entry in obj:
-            extract_when_model(entry, item_name, results, assets_root)
+def extract_select_cases(data, item_name, results, index, seen):
+    """
+    Fast path for has_select_cases() data: the top-level cases are handled in one pass,
+    only what is left (case models with nested selects, fallback, other keys) goes
+    through the generic extract_when_model() walk. Same results as walking everything.
+    """
+    model = data["model"]
+    rest = [v for k, v in data.items() if k != "model"]
+    rest.extend(v for k, v in model.items() if k != "cases")
+    for case in model["cases"]:
+        if isinstance(case, dict) and "when" in case and "model" in case:
+            add_when_model(case, item_name, results, index, seen)
+            rest.extend(case.values())
+        else:
+            rest.append(case)
+    extract_when_model(rest, item_name, results, index, seen)
 
 # -------------------------
-# Parse single JSON file and return results
+# Parse single JSON zip entry and return results
 # -------------------------
-def parse_when_model_file(file_path: Path, assets_root: Path):
+def parse_when_model_file(z: zipfile.ZipFile, info: zipfile.ZipInfo, index):
     results = []
     try:
-        data = json.loads(file_path.read_text(encoding="utf-8"))
+        data = json_loads(z.read(info))
     except Exception:
         return results
-    item_name = str(file_path.relative_to(assets_root)).replace("\\", "/")
-    extract_when_model(data, item_name, results, assets_root)
+    item_name = info.filename[len("assets/"):]
+    seen = set()
+    if has_select_cases(data):
+        extract_select_cases(data, item_name, results, index, seen)
+    else:
+        extract_when_model(data, item_name, results, index, seen)
     return results
 
+def is_parsed_asset(name):
+    # "assets/<ns>/<dir>/...json" -> parse only when <dir> is in PARSED_ASSET_DIRS
+    parts = name.split("/", 3)
+    return len(parts) == 4 and parts[2] in PARSED_ASSET_DIRS
+
 # -------------------------
 # Process a resourcepack zip, return list of rows
 # -------------------------
-def process_resourcepack(zip_path: Path):
-    temp_dir = Path(tempfile.mkdtemp(prefix="rp_"))
-    try:
-        with zipfile.ZipFile(zip_path, "r") as z:
-            z.extractall(temp_dir)
-        assets_root = temp_dir / "assets"
-        results = []
-        if not assets_root.exists():
+def process_resourcepack(zip_path: str):
+    """
+    zip_path is a plain string so the call can be shipped to a worker process.
+    """
+    results = []
+    with zipfile.ZipFile(zip_path, "r") as z:
+        # Read JSON entries under assets/ straight from the archive: nothing is extracted to disk
+        json_infos = [info for info in z.infolist()
+                      if info.filename.startswith("assets/") and info.filename.endswith(".json")]
+        if not json_infos:
             return results
-        # Walk json files under assets (we will parse all .json because newer packs may store models/items in different folders)
-        for json_file in assets_root.rglob("*.json"):
-            # parse file
-            parsed = parse_when_model_file(json_file, assets_root)
+        # paths relative to assets/, indexed once to resolve model references
+        index = build_model_index(info.filename[len("assets/"):] for info in json_infos)
+        # Only model-shaped JSON (assets/<ns>/models|items|overrides/**) is decompressed and parsed;
+        # textures/sounds are never read, empty entries are skipped (they can't parse anyway)
+        parse_infos = [info for info in json_infos if info.file_size and is_parsed_asset(info.filename)]
+        # Parsed serially: zip reads share one file lock and parsing holds the GIL,
+        # parallelism comes from the per-zip worker processes started by main()
+        for info in parse_infos:
+            parsed = parse_when_model_file(z, info, index)
             # parsed items are (item_name, [whens], [model_refs_or_files])
             for item_name, whens, model_refs in parsed:
                 # join model refs into one list (can be multiple)
                 if not model_refs:
                     model_refs = [""]
                 results.append((item_name, whens, model_refs))
-        return results
-    finally:
-        # keep temp until function ends, then cleanup
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    return results
 
 # -------------------------
 # Build table data structure
@@ -268,12 +376,7 @@ def build_table_from_packs(packs_rows):
                 else:
                     models_flat.append(m)
             # unique preserve order
-            seen = set()
-            models_unique = []
-            for m in models_flat:
-                if m not in seen:
-                    seen.add(m)
-                    models_unique.append(m)
+            models_unique = list(dict.fromkeys(models_flat))
             models_display = ", ".join(models_unique) if models_unique else ""
             rows_out.append({
                 "item": item_name,
@@ -286,86 +389,18 @@ def build_table_from_packs(packs_rows):
     return out
 
 # -------------------------
-# Generate interactive HTML (uses cfg.html as template with {{TABLES}} placeholder)
+# Static HTML pieces (same for every pack / every run)
 # -------------------------
-def generate_html(template_html, data_by_pack, cfg):
-    # Build HTML pieces into a table block per pack
-    parts = []
-    all_items = set()
-
-    for pack, rows in data_by_pack.items():
-        parts.append(f"<h2>{escape(pack)}</h2>\n")
-        # Optionally group by item
-        # Build mapping item -> model -> set(whens)
-        item_map = defaultdict(lambda: defaultdict(set))
-        for r in rows:
-            item = r["item"]
-            all_items.add(item)
-            # each model in models list -> add whens
-            if r["models"]:
-                for m in r["models"]:
-                    item_map[item][m].update(r["whens"])
-            else:
-                # no model -> use empty key
-                item_map[item][""].update(r["whens"])
-
-        # If config requests group_by_rename we'll show grouped; but interactive UI also allows toggle
-        # Create a container with data attributes for JS manipulation
-        table_container_id = f"pack_{escape(pack).replace(' ', '_')}"
-        parts.append(f"<div class='pack' id='{table_container_id}'>\n")
-
-        # Control bar: toggle grouping (JS will sync), copy/paste or other controls could be added
-        parts.append("""
+# Control bar: toggle grouping (JS will sync), copy/paste or other controls could be added
+CONTROLS_HTML = """
 <div class="controls">
   <label><input type="checkbox" class="toggle-grouping" checked> Group by model</label>
   <input type="text" class="filter-input" placeholder="Filter items / models / renames...">
 </div>
-""")
-
-        # Start table area
-        parts.append("<div class='tables-area'>\n")
-        # We'll output one table: each row = grouped model; columns order from cfg
-        cols = cfg.get("columns_order", ["Переименования", "Предмет", "Модель"])
-        parts.append(f"<table class='{escape(cfg.get('table_class','default-table'))}' data-pack='{escape(pack)}'>")
-        # header row (draggable)
-        parts.append("<thead><tr>")
-        for col in cols:
-            parts.append(f"<th draggable='true' class='col-header'>{escape(col)}</th>")
-        parts.append("</tr></thead>")
-
-        parts.append("<tbody>")
-        # iterate items -> models
-        for item_name in sorted(item_map):
-            models_for_item = item_map[item_name]
-            for model_key in sorted(models_for_item.keys()):
-                renames = sorted(models_for_item[model_key])
-                renames_str = ", ".join(renames)
-                model_display = model_key if model_key else ""
-                # produce row with columns in order (we'll later allow JS to reorder them)
-                row_cells = {
-                    "Переименования": renames_str,
-                    "Предмет": item_name,
-                    "Модель": model_display
-                }
-                parts.append("<tr class='data-row'>")
-                for col in cols:
-                    parts.append(f"<td>{escape(str(row_cells.get(col, '')))}</td>")
-                parts.append("</tr>")
-        parts.append("</tbody></table>\n")
-        parts.append("</div>")  # tables-area
-        parts.append("</div>")  # pack container
-
-    # All items list
-    if cfg.get("show_all_items_list", True):
-        parts.append(f"<details><summary>📋 All items ({len(all_items)})</summary>\n<ul>")
-        for it in sorted(all_items):
-            parts.append(f"<li>{escape(it)}</li>")
-        parts.append("</ul></details>")
-
-    tables_html = "\n".join(parts)
+"""
 
-    # Insert interactive JS/CSS into template (template must include {{TABLES}})
-    interactive_js = r"""
+# Interactive JS/CSS inserted into template together with the tables
+INTERACTIVE_JS = r"""
 <script>
 // Simple table filter & header drag-drop & sorting
 document.addEventListener('DOMContentLoaded', function(){
@@ -450,11 +485,27 @@ document.addEventListener('DOMContentLoaded', function(){
       });
     });
   });
+
+  // large "All items" lists are embedded as JSON and rendered on first open
+  document.querySelectorAll('details[data-items-json]').forEach(function(details){
+    details.addEventListener('toggle', function(){
+      if(!details.open || details.dataset.rendered) return;
+      const ul = details.querySelector('ul');
+      const frag = document.createDocumentFragment();
+      JSON.parse(details.dataset.itemsJson).forEach(function(item){
+        const li = document.createElement('li');
+        li.textContent = item;
+        frag.appendChild(li);
+      });
+      ul.appendChild(frag);
+      details.dataset.rendered = '1';
+    });
+  });
 });
 </script>
 """
 
-    interactive_css = r"""
+INTERACTIVE_CSS = r"""
 <style>
 .default-table { border-collapse: collapse; width:100%; margin:6px 0;}
 .default-table th, .default-table td { border:1px solid #ddd; padding:6px; text-align:left; }
@@ -467,10 +518,110 @@ th.desc::after{ content: " ▼"; }
 </style>
 """
 
-    final_html = template_html.replace("{{TABLES}}", tables_html + interactive_css + interactive_js)
-    # also replace title if present
-    final_html = final_html.replace("{{TITLE}}", escape(cfg.get("title","Resourcepack Report")))
-    return final_html
+# Same replacements as html.escape(s, quote=True), done in one str.translate pass
+HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+def esc(s):
+    return s.translate(HTML_ESCAPE_TABLE)
+
+# -------------------------
+# Generate interactive HTML (uses cfg.html as template with {{TABLES}} placeholder)
+# -------------------------
+def generate_html(template_html, data_by_pack, cfg):
+    """
+    Returns the page as a list of string chunks (template head, tables, JS/CSS, template tail)
+    meant to be streamed with writelines() instead of being joined into one big string.
+    """
+    # Build HTML pieces into a table block per pack
+    parts = []
+    all_items = set()
+
+    # Pieces that only depend on cfg are built once, not per pack
+    # We'll output one table per pack: each row = grouped model; columns order from cfg
+    cols = cfg.get("columns_order", ["Переименования", "Предмет", "Модель"])
+    table_class = esc(cfg.get('table_class','default-table'))
+    # header row (draggable)
+    header_html = "\n".join(["<thead><tr>"]
+                            + [f"<th draggable='true' class='col-header'>{esc(col)}</th>" for col in cols]
+                            + ["</tr></thead>"])
+    # row template: positional fields {0}=renames, {1}=item, {2}=model placed in cfg column order
+    cell_index = {"Переименования": 0, "Предмет": 1, "Модель": 2}
+    row_template = "\n".join(["<tr class='data-row'>"]
+                             + [f"<td>{{{cell_index[col]}}}</td>" if col in cell_index else "<td></td>" for col in cols]
+                             + ["</tr>"])
+
+    for pack, rows in data_by_pack.items():
+        parts.append(f"<h2>{esc(pack)}</h2>\n")
+        # Optionally group by item
+        # Build flat mapping (item, model) -> set(whens)
+        item_map = defaultdict(set)
+        for r in rows:
+            item = r["item"]
+            all_items.add(item)
+            # each model in models list -> add whens (no model -> use empty key)
+            for m in r["models"] or [""]:
+                item_map[(item, m)].update(r["whens"])
+
+        # If config requests group_by_rename we'll show grouped; but interactive UI also allows toggle
+        # Create a container with data attributes for JS manipulation
+        table_container_id = f"pack_{esc(pack).replace(' ', '_')}"
+        parts.append(f"<div class='pack' id='{table_container_id}'>\n")
+
+        parts.append(CONTROLS_HTML)
+
+        # Start table area
+        parts.append("<div class='tables-area'>\n")
+        parts.append(f"<table class='{table_class}' data-pack='{esc(pack)}'>")
+        parts.append(header_html)
+
+        parts.append("<tbody>")
+        # iterate items -> models (sorted keys keep rows of one item together);
+        # rows are produced with columns in order (we'll later allow JS to reorder them)
+        # and joined once per table body instead of one parts.append() per row
+        body = "\n".join(
+            row_template.format(esc(", ".join(sorted(renames))), esc(item_name), esc(model_key))
+            for (item_name, model_key), renames in sorted(item_map.items())
+        )
+        if body:
+            parts.append(body)
+        parts.append("</tbody></table>\n")
+        parts.append("</div>")  # tables-area
+        parts.append("</div>")  # pack container
+
+    # All items list
+    if cfg.get("show_all_items_list", True):
+        max_items = cfg.get("max_items_list")
+        # validated by load_config: int, or None (null in config.json) = "no limit"
+        if max_items is not None and len(all_items) > max_items:
+            # Too many items to emit as <li>: embed them once as JSON, JS renders the list on first open
+            items_json = esc(json_dumps(sorted(all_items)))
+            parts.append(f"<details data-items-json='{items_json}'><summary>📋 All items ({len(all_items)})</summary>\n<ul></ul></details>")
+        else:
+            parts.append(f"<details><summary>📋 All items ({len(all_items)})</summary>\n<ul>")
+            if all_items:
+                parts.append("\n".join(f"<li>{esc(it)}</li>" for it in sorted(all_items)))
+            parts.append("</ul></details>")
+
+    # Split template once around {{TABLES}}; also replace title if present
+    title = escape(cfg.get("title","Resourcepack Report"))
+    head, placeholder, tail = template_html.partition("{{TABLES}}")
+    chunks = [head.replace("{{TITLE}}", title)]
+    if placeholder:
+        # same layout as "\n".join(parts), without building the joined string
+        for i, part in enumerate(parts):
+            if i:
+                chunks.append("\n")
+            chunks.append(part)
+        chunks.append(INTERACTIVE_CSS)
+        chunks.append(INTERACTIVE_JS)
+        chunks.append(tail.replace("{{TITLE}}", title))
+    return chunks
 
 # -------------------------
 # Main runner
@@ -490,15 +641,23 @@ def main():
         print("❌ No .zip resourcepacks found in folder.")
         return
 
-    packs_rows = {}
-    for z in zip_files:
-        print(f"📦 Processing: {z.name}")
-        rows = process_resourcepack(z)
-        packs_rows[z.stem] = rows
+    # Each zip is independent (no shared state) -> one worker process per pack
+    rows_by_zip = {}
+    with ProcessPoolExecutor(max_workers=min(len(zip_files), os.cpu_count() or 1)) as ex:
+        futures = {ex.submit(process_resourcepack, str(z)): z for z in zip_files}
+        for fut in as_completed(futures):
+            z = futures[fut]
+            rows_by_zip[z] = fut.result()
+            print(f"📦 Processed: {z.name}")
+
+    # keep packs in the same order as the zip files were found
+    packs_rows = {z.stem: rows_by_zip[z] for z in zip_files}
 
     data_by_pack = build_table_from_packs(packs_rows)
-    final_html = generate_html(template_html, data_by_pack, cfg)
-    (base / OUTPUT_FILE).write_text(final_html, encoding="utf-8")
+    html_chunks = generate_html(template_html, data_by_pack, cfg)
+    # stream chunks through a large write buffer (no second full copy of the page in memory)
+    with open(base / OUTPUT_FILE, "w", encoding="utf-8", buffering=1024 * 1024) as f:
+        f.writelines(html_chunks)
     print(f"✅ Generated {OUTPUT_FILE}")
 
 if __name__ == "__main__":